@@ -85,6 +85,24 @@ class ClientConfig:
             polling_timeout: Maximum time to wait for polling operations
             tenant_id: Optional tenant ID for multi-tenant deployments
             proxy_url: Optional proxy URL for network requests
+            http2: Negotiate HTTP/2 via ALPN where the server supports
+                it, multiplexing concurrent API calls (prefetched pages,
+                coalesced batch gets, burst preflights like batch_prepare
+                and batch_confirm) over one TCP+TLS connection with no
+                head-of-line blocking between them. Requires the h2
+                package; falls back to HTTP/1.1 keep-alive otherwise.
+                Presigned storage PUTs always use HTTP/1.1, as S3-style
+                endpoints do not negotiate h2
+            max_connections: Maximum concurrent connections in the shared pool
+            max_keepalive_connections: Maximum idle keep-alive connections to retain
+            keepalive_expiry: Seconds before an idle connection is closed
+            pool_fifo: Lease idle connections in FIFO order to keep all
+                sockets warm (LIFO lets the tail of the pool idle out)
+            pool_min_idle: Minimum idle connections kept alive between bursts
+            max_requests_per_minute: Proactive client-side request pacing
+                (token bucket). When None, seeded from tenant limits on
+                first use; requests are paced to stay under the server's
+                rate limit instead of reacting to 429s
             circuit_breaker_enabled: Enable circuit breaker for resilience
             circuit_breaker_failure_threshold: Failures before opening circuit
             circuit_breaker_success_threshold: Successes to close circuit
@@ -105,6 +123,13 @@ class ClientConfig:
     polling_timeout: float = 360.0
     tenant_id: Optional[str] = field(default_factory=lambda: os.environ.get(ENV_TENANT_ID))
     proxy_url: Optional[str] = field(default_factory=lambda: os.environ.get(ENV_PROXY_URL))
+    http2: bool = True
+    max_connections: int = 128
+    max_keepalive_connections: int = 64
+    keepalive_expiry: float = 60.0
+    pool_fifo: bool = True
+    pool_min_idle: int = 4
+    max_requests_per_minute: Optional[int] = None
     circuit_breaker_enabled: bool = True
     circuit_breaker_failure_threshold: int = 5
     circuit_breaker_success_threshold: int = 2
@@ -35,6 +35,16 @@ def expand_paths(
     Directories are expanded to include all files with supported extensions.
     Regular files and bytes are passed through unchanged.
 
+    The walk is an iterative DFS over os.scandir entries: names that do not
+    match the lowercase extension tuple (one str.endswith) or that start
+    with a dot are skipped before any stat or MIME work, and hidden
+    directories are pruned before descending, so no Path objects are built
+    per entry and non-image files (README, .DS_Store) cost a single string
+    comparison. File sizes are captured inline from DirEntry.stat (cached by
+    scandir on most filesystems), so callers can build FileInfo records
+    without a second stat pass. Callers run this under asyncio.to_thread to
+    keep the thousands of stat/scandir syscalls off the event loop.
+
     Args:
         paths: List of file paths, directory paths, or bytes
         supported_extensions: Set of allowed file extensions (e.g. {'.jpg', '.png'})
@@ -95,7 +95,10 @@ class DocumentsResource:
                     object_key: Object key from request_upload()
                     size_bytes: Actual file size in bytes
                     content_type: MIME type of the uploaded file
-                    checksum: Optional MD5 checksum for verification
+                    checksum: Optional base64 CRC32C digest of the uploaded
+                        object. The presigned PUT carries the same digest as
+                        x-amz-checksum-crc32c, so storage verifies integrity
+                        without a second read of the file.
 
                 Returns:
                     DocumentConfirmResult with document_id and status
@@ -143,6 +146,33 @@ class DocumentsResource:
         """
         ...
 
+    async def batch_get_status(self, document_ids: list[str]) -> list[DocumentStatusResult]:
+        """
+
+                Get processing status for multiple documents in one request.
+
+                One round trip replaces a per-id get_status() loop; results
+                are returned in the order of document_ids. wait_for_many()
+                uses this to poll any number of documents with a single
+                request per tick.
+
+                Args:
+                    document_ids: Document identifiers (max 100)
+
+                Returns:
+                    List of DocumentStatusResult, ordered like document_ids
+
+                Raises:
+                    ValidationError: If list is empty or exceeds 100 ids
+
+                Example:
+                    ```python
+                    statuses = await client.documents.batch_get_status(doc_ids)
+                    pending = [s for s in statuses if not s.is_completed]
+                    ```
+        """
+        ...
+
     async def quota_check(self, file_count: int = 1) -> DocumentQuotaCheck:
         """
 
@@ -425,7 +455,9 @@ class DocumentsResource:
                         - object_key: Storage object key
                         - size_bytes: Actual file size
                         - content_type: MIME type
-                        - checksum: Optional MD5 checksum
+                        - checksum: Optional base64 CRC32C digest
+                          (matching the x-amz-checksum-crc32c sent
+                          with the presigned PUT)
 
                 Returns:
                     DocumentBatchConfirmResult with created documents and counts
@@ -503,6 +535,38 @@ class DocumentsResource:
         """
         ...
 
+    async def wait_for_many(self, document_ids: list[str], *, timeout: Optional[float] = None, poll_interval: Optional[float] = None) -> AsyncIterator[DocumentStatusResult]:
+        """
+
+                Wait on many documents with one poll loop, yielding each as
+                it reaches a terminal state.
+
+                A single loop calls batch_get_status() once per tick for all
+                still-pending ids, instead of N independent
+                wait_for_processing() pollers each issuing their own GET.
+                Poll traffic (and server-side status lookups) drop from N
+                per tick to 1, regardless of how many documents are waited
+                on. Documents are yielded in completion order.
+
+                Args:
+                    document_ids: Document identifiers to wait for
+                    timeout: Maximum total wait time in seconds (default: 600)
+                    poll_interval: Interval between batch polls (default: from config)
+
+                Yields:
+                    DocumentStatusResult for each document as it terminalizes
+
+                Raises:
+                    AionvisionTimeoutError: If timeout is exceeded with ids still pending
+
+                Example:
+                    ```python
+                    async for status in client.documents.wait_for_many(doc_ids):
+                        print(f"{status.document_id}: {status.text_extraction_status}")
+                    ```
+        """
+        ...
+
     async def upload_one(self, file: Union[str, Path, bytes], *, filename: Optional[str] = None, wait_for_processing: bool = True, raise_on_failure: bool = True, processing_timeout: Optional[float] = None, storage_target: str = 'default') -> DocumentUploadResult:
         """
 
@@ -5,6 +5,12 @@ from typing import Any, Optional
 from ..config import ClientConfig
 from ..exceptions import ValidationError
 from ..types.files import BatchDeleteFilesResponse, DeleteFileResult, FileList, UpdateFileResult, UserFile, UserFileDetails
+VALID_VARIANT_TYPES = frozenset({'original', 'tiny_64', 'small_256', 'medium_512', 'medium_750', 'large_1024'})
+_FILE_URL = '/files/%s'
+_FILE_DOWNLOAD_URL = '/files/%s/download'
+_FILE_VARIANT_URL = '/files/%s/variants/%s'
+_FILE_VARIANT_GENERATION_URL = '/files/%s/generate-variants'
+VARIANT_URL_CACHE_TTL = 3300.0
 
 
 class FilesResource:
@@ -32,6 +38,11 @@ class FilesResource:
 
                 List user files with optional filtering and pagination.
 
+                When called with a single-element ids filter and no other
+                filters, the request is served via get() (including its
+                cache) and wrapped in a single-element FileList, avoiding
+                the heavier server-side list query.
+
                 Args:
                     search: Search query for titles and descriptions
                     search_mode: Search scope - 'all', 'metadata', or 'visible_text'
@@ -106,6 +117,10 @@ class FilesResource:
                 Returns full file details including all descriptions, visible text,
                 tags, processing history, and image variant URLs.
 
+                Concurrent calls for the same file_id are coalesced: callers
+                that arrive while a request is already in flight await the
+                same response instead of issuing duplicate requests.
+
                 Args:
                     file_id: Unique file identifier (UUID)
 
@@ -217,6 +232,12 @@ class FilesResource:
 
                 Get redirect URL for an image variant.
 
+                Variant URLs already known client-side are served without a
+                network round trip: if a recent get() response for the same
+                file is cached, or the same variant was fetched within the
+                presigned-URL lifetime, the cached URL is returned directly.
+                update() and delete() invalidate cached entries for the file.
+
                 Args:
                     file_id: Unique file identifier (UUID)
                     variant_type: Variant size - one of:
@@ -231,7 +252,8 @@ class FilesResource:
                     Presigned URL to the image variant
 
                 Raises:
-                    ValidationError: If variant_type is invalid
+                    ValidationError: If variant_type is not one of the values above
+                        (checked client-side; no request is issued)
                     ResourceNotFoundError: If file or variant not found
 
                 Example:
@@ -7,6 +7,7 @@ MAX_FOLDER_NAME_LENGTH = 255
 FORBIDDEN_NAME_CHARS = frozenset('/\\\x00')
 VALID_DELETE_MODES = {'move_to_parent', 'delete_all'}
 MAX_MOVE_FILES_BATCH = 100
+TREE_CACHE_TTL = 30.0
 
 
 class FoldersResource:
@@ -34,6 +35,14 @@ class FoldersResource:
 
                 Get the complete folder tree.
 
+                The tree is cached for a short window (TREE_CACHE_TTL) and
+                indexed by folder ID, which lets get_breadcrumbs() answer
+                locally. Cache entries are tagged with a monotonic
+                generation counter; create(), rename(), move(), delete(),
+                and move_files() bump the generation, so any mutation
+                invalidates the cache atomically even under concurrent
+                tree() calls.
+
                 Returns:
                     FolderTree with all folders
 
@@ -78,6 +87,12 @@ class FoldersResource:
 
                 Get the breadcrumb path for a folder.
 
+                When a fresh tree() result is cached, the path is computed
+                client-side by walking parent_id links (O(depth), no network
+                round trip). Falls back to the API otherwise. create(),
+                rename(), move(), delete(), and move_files() invalidate
+                the cached tree.
+
                 Args:
                     folder_id: Unique folder identifier
 
@@ -206,6 +221,8 @@ class FoldersResource:
 
                 Move files to a folder.
 
+                Invalidates the cached folder tree (file counts change).
+
                 Args:
                     file_ids: List of file IDs to move (1-100, no duplicates)
                     folder_id: Target folder ID (None to move to root)
@@ -13,6 +13,7 @@ class SettingsResource:
         Once configured, you can use storage_target='custom' in upload calls
         to store files directly in your bucket.
     """
+    __slots__ = ('_http', '_config')
 
     def __init__(self, http: HTTPClient, config: ClientConfig) -> None:
         """
@@ -36,6 +37,9 @@ class SettingsResource:
                 The provided credentials are validated by testing bucket access,
                 then encrypted and stored securely on Aionvision's servers.
 
+                The request body is serialized once as immutable bytes and
+                reused as-is by automatic retries on transient failures.
+
                 Args:
                     access_key_id: AWS access key ID (must have s3:PutObject permission)
                     secret_access_key: AWS secret access key
@@ -14,6 +14,7 @@ class TenantResource:
 
         Note: Most member management operations require OWNER role.
     """
+    __slots__ = ('_http', '_config')
 
     def __init__(self, http: HTTPClient, config: ClientConfig) -> None:
         """
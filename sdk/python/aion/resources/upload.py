@@ -1,7 +1,6 @@
 from __future__ import annotations
 import asyncio
 import logging
-import mimetypes
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
@@ -12,10 +11,56 @@ from ..types.common import DescriptionStatus as DescriptionStatusEnum, StorageTa
 from ..types.describe import DescriptionFailure, DescriptionStatus
 from ..types.upload import BatchUploadResults, QuotaInfo, UploadResult
 logger = logging.getLogger(__name__)
-SUPPORTED_CONTENT_TYPES = {'image/jpeg', 'image/png', 'image/webp', 'image/gif'}
+SUPPORTED_CONTENT_TYPES = frozenset({'image/jpeg', 'image/png', 'image/webp', 'image/gif'})
 BATCH_CHUNK_SIZE = 1000
 MAX_BATCH_FILES = 10000
-SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
+SUPPORTED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif'})
+_EXT_TUPLE = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+_EXT_TO_MIME = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png', '.webp': 'image/webp', '.gif': 'image/gif'}
+_STATUS_COMPLETED = DescriptionStatusEnum.COMPLETED
+_STATUS_FAILED = DescriptionStatusEnum.FAILED
+_STATUS_PROCESSING = DescriptionStatusEnum.PROCESSING
+_TARGET_DEFAULT = StorageTarget.DEFAULT
+_TARGET_CUSTOM = StorageTarget.CUSTOM
+_BUFFER_BUCKET_SIZES = (65536, 524288, 4194304, 16777216)
+UPLOAD_STREAM_CHUNK_SIZE = 65536
+PRESIGN_WINDOW_SIZE = 200
+
+async def _file_chunks(path: Union[str, Path], size: int, chunk: int = UPLOAD_STREAM_CHUNK_SIZE):
+    """Yield a file in fixed-size chunks, updating the running checksum in-line."""
+    ...
+
+def _sha256_file(path: Union[str, Path]) -> str:
+    """Compute a file's SHA-256 via hashlib.file_digest (runs under to_thread)."""
+    ...
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a JSON payload to bytes (orjson when installed, stdlib fallback)."""
+    ...
+
+def _loads(content: bytes) -> Any:
+    """Deserialize a JSON response body (orjson when installed, stdlib fallback)."""
+    ...
+
+
+class _BufferPool:
+    """
+
+        Size-bucketed bytearray pool shared by concurrent upload tasks.
+
+        Buffers are checked out by file size bucket and recycled on release,
+        so a batch upload reuses a bounded set of buffers instead of
+        allocating and freeing one per file. Files larger than the biggest
+        bucket fall back to a streaming body and never go through the pool.
+    """
+
+    def acquire(self, size_bytes: int) -> bytearray:
+        """Check out a buffer at least size_bytes long (blocks at the bucket cap)."""
+        ...
+
+    def release(self, buf: bytearray) -> None:
+        """Return a buffer to its bucket for reuse."""
+        ...
 
 
 class UploadResource:
@@ -120,7 +165,10 @@ class UploadResource:
                     - results.retryable(): Get retryable failures
 
                 Raises:
-                    ValidationError: If more than 10,000 files or unsupported type
+                    ValidationError: If more than 10,000 files or unsupported type.
+                        Validation runs over the whole batch first and reports
+                        every invalid file in one error rather than failing on
+                        the first
                     QuotaExceededError: If upload quota is insufficient
                     UploadError: If upload fails
                     DescriptionError: If any description fails and raise_on_failure=True
@@ -154,14 +202,30 @@ class UploadResource:
                 (jpg, jpeg, png, webp, gif). Supports up to 10,000 files by
                 automatically chunking into 100-file batches.
 
-                Concurrency is controlled by the backend configuration (not user-configurable).
+                Presigned URLs are requested just-in-time in windows of
+                PRESIGN_WINDOW_SIZE as earlier windows drain, rather than
+                for the whole batch upfront, so long-running batches never
+                hit URL expiry and the first byte goes out sooner. Chunks
+                are pipelined: the next chunk's batch_prepare round trip
+                runs while the current chunk is still uploading, so chunk
+                boundaries cost no idle network time.
+
+                Concurrency is controlled by the backend configuration (not
+                user-configurable). Uploads run under a semaphore and are
+                drained as they complete, so on_file_complete fires the
+                moment each file finishes and per-file state is freed
+                mid-batch instead of being held until the whole batch ends.
 
                 Args:
                     files: File path, directory path, or list of paths (up to 10,000 files)
                     filenames: Override filenames (required if files are bytes)
                     recursive: Search directories recursively (default: True)
                     include_hidden: Include hidden files starting with . (default: False)
-                    wait_for_descriptions: Wait for all AI descriptions
+                    wait_for_descriptions: Wait for all AI descriptions. The
+                        wait phase polls the aggregate session status once per
+                        tick and diffs per-item states to drive callbacks,
+                        instead of polling every image individually; only
+                        completed images fetch their description body.
                     raise_on_failure: Raise DescriptionError if any description fails
                         (default: True). Set to False to handle failures manually.
                     description_timeout: Override polling timeout
@@ -222,10 +286,16 @@ class UploadResource:
 
                 Poll until description is ready.
 
+                Polls with jittered exponential backoff: delays start at a
+                quarter of poll_interval, double per poll up to poll_interval,
+                and carry +/-25% jitter so thousands of concurrent waiters do
+                not poll in lockstep. Concurrent polls across the client are
+                capped by a shared semaphore.
+
                 Args:
                     image_id: Image identifier
                     timeout: Maximum wait time (default: from config)
-                    poll_interval: Polling interval (default: from config)
+                    poll_interval: Backoff ceiling between polls (default: from config)
 
                 Returns:
                     DescriptionStatus with description data
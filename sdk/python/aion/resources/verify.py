@@ -1,14 +1,23 @@
 from __future__ import annotations
+import asyncio
 import base64
 import mimetypes
 import warnings
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
-import aiofiles
 from ..config import ClientConfig, InsecureTransportWarning
 from ..exceptions import ValidationError
 from ..types.batch import BatchImageInput, BatchItemStatus, BatchResults, BatchStatus, BatchStatusResult, BatchSubmissionResult, BatchVerifyInput
 from ..types.verify import VerificationIssue, VerificationResult
+INLINE_BASE64_MAX_BYTES = 262144
+
+def _emit_deprecation() -> None:
+    """Emit the VerifyResource deprecation warning once per process."""
+    ...
+
+def _encode_data_url(mime: str, data: bytes) -> str:
+    """Build a base64 data URL with a single bytes concat and one decode."""
+    ...
 
 
 class VerifyResource:
@@ -20,6 +29,7 @@ class VerifyResource:
             This class is deprecated. Verification functionality is being removed
             as a standalone operation. Use :meth:`AionVision.upload` for image processing.
             This class will be removed in a future version.
+            The DeprecationWarning is emitted once per process, not per call.
 
         Verify content accuracy and detect hallucinations.
     """
@@ -43,6 +53,12 @@ class VerifyResource:
                 For single images, uses synchronous API. For multiple images,
                 uses batch API with automatic polling.
 
+                Images larger than INLINE_BASE64_MAX_BYTES are uploaded to a
+                presigned URL and passed by object_key instead of being
+                base64-inlined in the request body, avoiding the 33% payload
+                inflation and encode/decode CPU on big files. Small images
+                still go inline, where a single round trip is cheaper.
+
                 Single mode:
                     verify(image="img.jpg", content="A red car")
 
@@ -2,29 +2,144 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Iterator, Optional, Union
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterator, Optional, Union
 from .client import AionVision
 from .config import ClientConfig
-from .types.settings import S3ConfigStatus, S3ValidationResult
-from .types import DescriptionFailedEvent, DescriptionProgressEvent, DescriptionStatus, FileCompleteEvent, UploadProgressEvent
-from .types.callbacks import DocumentFileCompleteEvent, DocumentProcessingFailedEvent, DocumentProcessingProgressEvent, DocumentUploadProgressEvent
-from .types.audit import AuditLogEntry, AuditLogList
-from .types.batch import BatchItemResult, BatchResults, BatchStatusResult
-from .types.chat import ChatImageList, ChatMessage, ChatResponse, ChatSession, ChatSessionDetail, ImageReference, PlanActionResponse, SessionList
-from .types.colors import BatchColorExtractionResult, ColorExtractionResult, ColorFamilyInfo, ColorSearchResponse, ColorSearchResult
 from .types.common import StorageTarget
-from .types.files import BatchDeleteFilesResponse, DeleteFileResult, FileList, UpdateFileResult, UserFile, UserFileDetails
-from .types.tenant import TenantLimits, TenantMember, TenantSettings
-from .types.agent_operations import DocumentAnalysisResult, OrganizeResult, SynthesizeResult
-from .types.agent_search import DocumentSearchAgentResult, ImageSearchAgentResult, VideoSearchAgentResult
-from .types.callbacks import VideoAnalysisProgressEvent, VideoChunkProgressEvent, VideoUploadCompleteEvent
-from .types.video import BatchVideoUploadSession, ChunkConfirmResult, ChunkRetryResult, VideoAbortResult, VideoAnalysisJobStatus, VideoAnalysisQueueResult, VideoAnalysisRetryResult, VideoAnalysisStatus, VideoChunkInfo, VideoMetadata, VideoScene, VideoSceneList, VideoUploadProgress, VideoUploadResult, VideoUploadSession, VideoUploadStatus
-from .types.documents import BatchDocumentUploadResults, DocumentBatchConfirmResult, DocumentBatchDeleteResponse, DocumentBatchPrepareResult, DocumentBatchStatusResult, DocumentChunksResponse, DocumentConfirmResult, DocumentDetails, DocumentItem, DocumentList, DocumentPresignedUploadResult, DocumentQuotaCheck, DocumentSearchResponse, DocumentStatusResult, DocumentUploadResult
-from .types.folders import DeleteFolderResult, Folder, FolderBreadcrumbs, FolderContents, FolderTree, MoveFilesResult
-from .types.links import CreateLinkResult, LinkDeleteResult, LinkDetails, LinkItem, LinkList, LinkUpdateResult, RecrawlLinkResult
-from .types.callbacks import CloudStorageJobProgressEvent
-from .types.cloud_storage import CloudFileInput, CloudStorageConnection, CloudStorageJob, CompleteAuthResult, ConnectionList, DisconnectResult, ExportResult, ImportResult, InitiateAuthResult
-from .types.upload import BatchUploadResults, QuotaInfo, UploadResult
+
+if TYPE_CHECKING:
+    from .types.settings import S3ConfigStatus, S3ValidationResult
+    from .types import DescriptionFailedEvent, DescriptionProgressEvent, DescriptionStatus, FileCompleteEvent, UploadProgressEvent
+    from .types.callbacks import DocumentFileCompleteEvent, DocumentProcessingFailedEvent, DocumentProcessingProgressEvent, DocumentUploadProgressEvent
+    from .types.audit import AuditLogEntry, AuditLogList
+    from .types.batch import BatchItemResult, BatchResults, BatchStatusResult
+    from .types.chat import ChatImageList, ChatMessage, ChatResponse, ChatSession, ChatSessionDetail, ImageReference, PlanActionResponse, SessionList
+    from .types.colors import BatchColorExtractionResult, ColorExtractionResult, ColorFamilyInfo, ColorSearchResponse, ColorSearchResult
+    from .types.files import BatchDeleteFilesResponse, DeleteFileResult, FileList, UpdateFileResult, UserFile, UserFileDetails
+    from .types.tenant import TenantLimits, TenantMember, TenantSettings
+    from .types.agent_operations import DocumentAnalysisResult, OrganizeResult, SynthesizeResult
+    from .types.agent_search import DocumentSearchAgentResult, ImageSearchAgentResult, VideoSearchAgentResult
+    from .types.callbacks import VideoAnalysisProgressEvent, VideoChunkProgressEvent, VideoUploadCompleteEvent
+    from .types.video import BatchVideoUploadSession, ChunkConfirmResult, ChunkRetryResult, VideoAbortResult, VideoAnalysisJobStatus, VideoAnalysisQueueResult, VideoAnalysisRetryResult, VideoAnalysisStatus, VideoChunkInfo, VideoMetadata, VideoScene, VideoSceneList, VideoUploadProgress, VideoUploadResult, VideoUploadSession, VideoUploadStatus
+    from .types.documents import BatchDocumentUploadResults, DocumentBatchConfirmResult, DocumentBatchDeleteResponse, DocumentBatchPrepareResult, DocumentBatchStatusResult, DocumentChunksResponse, DocumentConfirmResult, DocumentDetails, DocumentItem, DocumentList, DocumentPresignedUploadResult, DocumentQuotaCheck, DocumentSearchResponse, DocumentStatusResult, DocumentUploadResult
+    from .types.folders import DeleteFolderResult, Folder, FolderBreadcrumbs, FolderContents, FolderTree, MoveFilesResult
+    from .types.links import CreateLinkResult, LinkDeleteResult, LinkDetails, LinkItem, LinkList, LinkUpdateResult, RecrawlLinkResult
+    from .types.callbacks import CloudStorageJobProgressEvent
+    from .types.cloud_storage import CloudFileInput, CloudStorageConnection, CloudStorageJob, CompleteAuthResult, ConnectionList, DisconnectResult, ExportResult, ImportResult, InitiateAuthResult
+    from .types.upload import BatchUploadResults, QuotaInfo, UploadResult
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 lazy re-export of the .types.* names used in signatures.
+
+    Importing aion.sync no longer loads every types submodule (and its
+    hundreds of model classes) up front; each is imported on first
+    attribute access. Cuts cold import time for short-lived scripts and
+    Lambda-style callers that touch only one resource.
+    """
+    ...
+MULTIPART_THRESHOLD_BYTES = 8388608
+MULTIPART_PART_SIZE_BYTES = 16777216
+MULTIPART_MAX_CONCURRENCY = 4
+IO_EXECUTOR_MAX_WORKERS = 8
+DOWNLOAD_CHUNK_BYTES = 1048576
+LIST_ETAG_CACHE_SIZE = 256
+COALESCE_WINDOW_SECONDS = 0.002
+COALESCE_MAX_BATCH = 100
+
+
+class _BatchCoalescer:
+    """
+    Coalesces concurrent single-id status checks into one batched request.
+
+        get_status(id) calls arriving from multiple threads within
+        COALESCE_WINDOW_SECONDS (or until COALESCE_MAX_BATCH ids are
+        queued) are merged on the loop side into one batch_get_status
+        call, and the results are fanned back out to per-caller
+        futures. Used by documents.get_status, where
+        ThreadPoolExecutor-style callers commonly poll many documents
+        concurrently: N concurrent checks cost one round trip instead
+        of N. A lone call waits at most one window (2 ms) beyond its
+        own RTT. Scoped to documents because that is the only resource
+        with a batch-details endpoint; file and link gets return full
+        detail objects that no batch endpoint provides.
+    """
+    __slots__ = ('_pending', '_flush_handle', '_batch_call', '_loop')
+
+    def submit(self, item_id: str):
+        """Queue an id and return a future for its individual result."""
+        ...
+
+
+class _PrefetchingIterator:
+    """
+    Pipelined page iterator shared by the sync list_all/iter_sessions/
+        search_all/get_all_results helpers.
+
+        As soon as page N is handed to the consumer, page N+1 is scheduled
+        on the event loop, so the network round trip for the next page
+        overlaps with the consumer's per-item work instead of following
+        it. When the current page is exhausted the next one is usually
+        already in flight or complete. Latency to the first item is
+        unchanged; the in-flight request is cancelled if the iterator is
+        discarded early.
+    """
+    __slots__ = ('_fetch', '_loop', '_pending', '_page_size')
+
+    def __iter__(self):
+        ...
+
+    def __next__(self):
+        ...
+
+
+class _SyncRuntime:
+    """
+    Process-global runtime shared by all SyncAionVision instances.
+
+        Owns the one background event-loop thread (uvloop where
+        available), the one pooled httpx client, and the one "aion-io"
+        ThreadPoolExecutor for the whole process. Each SyncAionVision
+        attaches on __enter__ and detaches on __exit__ (refcounted);
+        N sync clients therefore cost one loop, one thread stack, and
+        one connection pool instead of N of each, and requests from
+        different clients to the same host reuse the same keep-alive
+        connections. Final teardown runs at interpreter exit via
+        atexit once the refcount is zero.
+
+        Per-instance state (api_key, tenant_id, base_url) travels with
+        each submitted coroutine via contextvars, so clients with
+        different credentials can share the runtime safely.
+    """
+    __slots__ = ('_loop', '_thread', '_client', '_executor', '_refcount', '_lock')
+
+    @classmethod
+    def attach(cls) -> _SyncRuntime:
+        """Get the shared runtime, starting it on first use (refcounted)."""
+        ...
+
+    @classmethod
+    def detach(cls) -> None:
+        """Drop one reference; the runtime outlives zero refs until atexit."""
+        ...
+
+
+class _LazyTypeExportsMeta(type):
+    """
+    Metaclass resolving the type re-exports on SyncAionVision lazily.
+
+        SyncAionVision historically re-exported ~140 model classes and
+        enums as class attributes (SyncAionVision.ChatResponse,
+        SyncAionVision.RateLimitError, ...), which forced every types
+        submodule to import eagerly with aion.sync. Those names are now
+        resolved here on first attribute access and cached on the class,
+        so importing aion.sync only loads the modules a program actually
+        touches. Resolution is a dict lookup into a static name -> module
+        table; unknown names raise AttributeError as before.
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        """Import and cache the types submodule export named ``name``."""
+        ...
 
 
 class SyncChatSession:
@@ -100,6 +215,9 @@ class SyncChatSession:
                 Returns True if:
                 - The session was explicitly closed, OR
                 - The parent client's event loop was closed
+
+                The closed state is latched: once this flips True it is
+                remembered and the loop is never re-queried.
         """
         ...
 
@@ -178,7 +296,38 @@ class SyncChatSession:
 
 
 class _SyncResourceBase:
-    """Base class for sync resource wrappers with loop validation."""
+    """
+    Base class for sync resource wrappers with loop validation.
+
+        Calls are bridged to the event loop with a single
+        loop.call_soon_threadsafe dispatch into a reusable thread-local
+        concurrent.futures.Future instead of allocating a fresh future via
+        run_coroutine_threadsafe on every call. This halves the lock
+        traffic per call and removes per-call Future construction, which
+        is measurable on short calls like get_status and quota_check.
+
+        Loop-state checks are cached at construction: the bound
+        loop.is_closed and call_soon_threadsafe methods are stashed once,
+        so per-call validation is two attribute-free calls rather than
+        repeated attribute lookups on the loop object. Small per call,
+        but multiplied across list_all/iter_* loops.
+
+        Coroutines that resolve without suspending (async-layer cache
+        hits such as a fresh folder tree) still pay one bridge hop,
+        but run eagerly: the dispatch callback drives the first step
+        of the coroutine on the loop thread immediately, so a cache
+        hit completes inside that callback and never costs a Task
+        allocation or an extra loop iteration. Wrappers that memoize
+        results themselves (tenant settings) skip the bridge entirely
+        and answer from the calling thread.
+
+        Only methods that actually hit the network are bridged. Methods
+        on returned result objects that do no I/O (as_collection,
+        get_output, ref parsing) are ordinary synchronous code and run
+        in the calling thread — wrappers never route pure transforms
+        through the loop.
+    """
+    __slots__ = ('_async', '_loop', '_loop_is_closed', '_call_soon', '_local')
 
     def __init__(self, async_resource, loop: asyncio.AbstractEventLoop):
         ...
@@ -188,13 +337,35 @@ class SyncFilesResource(_SyncResourceBase):
     """Synchronous wrapper for file operations."""
 
     def list(self, *, search: Optional[str] = None, search_mode: str = 'all', tags: Optional[list[str]] = None, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None, has_description: Optional[bool] = None, ids: Optional[list[str]] = None, media_types: Optional[list[str]] = None, limit: int = 20, offset: int = 0, sort_by: str = 'content_created_at', sort_order: str = 'desc') -> FileList:
-        """List files with search/filter/pagination."""
+        """
+        List files with search/filter/pagination.
+
+                List and search GETs are issued conditionally: the client
+                keeps an LRU (LIST_ETAG_CACHE_SIZE entries, keyed by
+                endpoint plus canonicalized query) of ETag and parsed body,
+                and sends If-None-Match on repeat calls. A 304 returns the
+                cached parsed page with no body transfer and no model
+                re-construction. Also applies to colors/links/documents/
+                audit list and search calls.
+        """
         ...
 
     def list_all(self, *, search: Optional[str] = None, search_mode: str = 'all', tags: Optional[list[str]] = None, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None, has_description: Optional[bool] = None, media_types: Optional[list[str]] = None, sort_by: str = 'content_created_at', sort_order: str = 'desc', page_size: int = 50) -> Iterator[UserFile]:
         """
         Iterate through all files with automatic pagination.
 
+                Pages are prefetched: the next page is requested on the event
+                loop while the current page is being consumed, hiding one
+                round trip per page boundary (see _PrefetchingIterator).
+
+                Pages after the first are fetched with the opaque next_cursor
+                token from the previous page instead of a growing offset, so
+                the server resumes from the last (sort_key, id) rather than
+                re-filtering and re-sorting from scratch each page, and the
+                iteration stays stable when items are inserted or deleted
+                mid-walk. Offset paging is the fallback for servers that do
+                not return next_cursor.
+
                 Args:
                     search: Search query for titles and descriptions
                     search_mode: Search scope - 'all', 'metadata', or 'visible_text'
@@ -218,7 +389,12 @@ class SyncFilesResource(_SyncResourceBase):
         ...
 
     def get(self, file_id: str) -> UserFileDetails:
-        """Get detailed file info."""
+        """
+        Get detailed file info.
+
+                Concurrent gets for the same file_id share one in-flight
+                request rather than issuing duplicates.
+        """
         ...
 
     def update(self, file_id: str, *, title: Optional[str] = None, tags: Optional[list[str]] = None) -> UpdateFileResult:
@@ -238,7 +414,46 @@ class SyncFilesResource(_SyncResourceBase):
         ...
 
     def download(self, file_id: str) -> bytes:
-        """Download the original file."""
+        """
+        Download the original file.
+
+                Materializes the whole object in memory. For large files
+                prefer download_to() or iter_download(), which stream in
+                DOWNLOAD_CHUNK_BYTES chunks with O(chunk) peak memory.
+        """
+        ...
+
+    def download_to(self, file_id: str, dst: Union[BinaryIO, str, Path]) -> int:
+        """
+        Stream a file directly to a path or writable binary stream.
+
+                Chunks are written as they arrive instead of buffering the
+                full body, so peak memory is one chunk regardless of file
+                size. Returns the number of bytes written.
+
+                Args:
+                    file_id: Unique file identifier
+                    dst: Destination path or open binary stream
+
+                Returns:
+                    Total bytes written
+        """
+        ...
+
+    def iter_download(self, file_id: str) -> Iterator[bytes]:
+        """
+        Iterate over a file's bytes in streamed chunks.
+
+                Chunks are bridged from the event loop through a small
+                bounded queue, so a slow consumer backpressures the network
+                read instead of accumulating the body in memory.
+
+                Args:
+                    file_id: Unique file identifier
+
+                Yields:
+                    Chunks of file content as bytes
+        """
         ...
 
     def trigger_variant_generation(self, file_id: str) -> dict[str, Any]:
@@ -277,6 +492,32 @@ class SyncChatResource(_SyncResourceBase):
         """Get messages from a session."""
         ...
 
+    def resolve_images(self, refs: list[ImageReference]) -> list[UserFileDetails]:
+        """
+        Fetch full file details for a response's image references.
+
+                Dispatches one coroutine that gathers all the files.get()
+                calls concurrently on the event loop, so N references cost
+                one sync/async bridge hop and roughly one round-trip time
+                instead of N sequential fetches. Results are returned in
+                the same order as refs.
+
+                Args:
+                    refs: Image references from a ChatResponse (response.images)
+
+                Returns:
+                    UserFileDetails for each reference, in input order
+
+                Example:
+                    ```python
+                    response = client.chats.send("Find damaged poles", session_id=sid)
+                    details = client.chats.resolve_images(response.images)
+                    for d in details:
+                        print(d.title, d.full_url)
+                    ```
+        """
+        ...
+
     def update_images(self, session_id: str, image_ids: list[str]) -> dict[str, Any]:
         """Update images in a session."""
         ...
@@ -369,11 +610,22 @@ class SyncBatchResource(_SyncResourceBase):
         """
         Wait for batch to complete.
 
+                When the server supports status streaming (SSE), the waiter
+                subscribes to the batch's event stream and blocks until a
+                terminal status is pushed, instead of issuing one GET per
+                poll interval. Each streamed event is forwarded straight to
+                on_progress without an extra status request. On servers
+                without streaming the fixed-interval poll loop is used, with
+                poll_interval controlling the cadence. The same mechanism
+                backs wait_for_description, wait_for_processing,
+                wait_for_crawl and wait_for_job.
+
                 Args:
                     batch_id: The batch ID to wait for
                     timeout: Maximum time to wait (seconds)
-                    poll_interval: Time between status checks (seconds)
-                    on_progress: Callback invoked with status on each poll
+                    poll_interval: Time between status checks (seconds);
+                        used only on the polling fallback path
+                    on_progress: Callback invoked with each status update
         """
         ...
 
@@ -402,11 +654,17 @@ class SyncTenantResource(_SyncResourceBase):
     """Synchronous wrapper for tenant operations."""
 
     def get_settings(self) -> TenantSettings:
-        """Get tenant settings."""
+        """Get tenant settings.
+
+        The settings object is memoized in the wrapper after the first
+        fetch: repeat calls return the cached frozen value directly from
+        the calling thread, with no coroutine construction and no loop
+        hop. update_settings() drops the cached value.
+        """
         ...
 
     def update_settings(self, *, name: Optional[str] = None, webhook_url: Optional[str] = None, allowed_vlm_providers: Optional[list[str]] = None, allowed_domains: Optional[list[str]] = None, max_monthly_credits: Optional[int] = None, max_requests_per_minute: Optional[int] = None, custom_config: Optional[dict[str, Any]] = None) -> TenantSettings:
-        """Update tenant settings."""
+        """Update tenant settings. Invalidates the get_settings() cache."""
         ...
 
     def get_limits(self) -> TenantLimits:
@@ -455,7 +713,16 @@ class SyncUploadResource(_SyncResourceBase):
 
 
 class SyncAgentSearchResource(_SyncResourceBase):
-    """Synchronous wrapper for agent search operations."""
+    """
+    Synchronous wrapper for agent search operations.
+
+        Only the network call crosses the sync/async bridge. The returned
+        result objects are plain frozen dataclasses, so pure-Python
+        post-processing (as_collection(), result_refs access, iterating
+        results) runs directly in the calling thread with no event-loop
+        hop — the ~100 us bridge round trip is paid once per search, not
+        once per transform.
+    """
 
     def images(self, query: str, *, limit: int = 50, folder_id: Optional[str] = None, image_ids: Optional[list[str]] = None) -> ImageSearchAgentResult:
         """Execute AI-powered image search."""
@@ -494,11 +761,44 @@ class SyncDocumentsResource(_SyncResourceBase):
         ...
 
     def confirm_upload(self, object_key: str, size_bytes: int, content_type: str, *, checksum: Optional[str] = None) -> DocumentConfirmResult:
-        """Confirm a document upload after uploading the file."""
+        """
+        Confirm a document upload after uploading the file.
+
+                Args:
+                    object_key: Storage key returned by request_upload
+                    size_bytes: Uploaded object size
+                    content_type: MIME type of the uploaded object
+                    checksum: Optional base64 CRC32C digest. upload_one
+                        computes this while streaming chunks (hardware CRC
+                        when google-crc32c is installed, multi-GB/s versus
+                        ~400 MB/s for MD5) and the presigned PUT carries it
+                        as x-amz-checksum-crc32c, so storage verifies
+                        integrity without a second read of the file.
+        """
         ...
 
     def get_status(self, document_id: str) -> DocumentStatusResult:
-        """Get document processing status."""
+        """Get document processing status.
+
+        Concurrent calls from multiple threads are coalesced into one
+        batch_get_status request (see _BatchCoalescer).
+        """
+        ...
+
+    def batch_get_status(self, document_ids: list[str]) -> list[DocumentStatusResult]:
+        """Get processing status for multiple documents in one request."""
+        ...
+
+    def wait_for_many(self, document_ids: list[str], *, timeout: Optional[float] = None, poll_interval: Optional[float] = None) -> Iterator[DocumentStatusResult]:
+        """
+        Wait on many documents with one poll loop, yielding each as it
+                reaches a terminal state.
+
+                One batch_get_status() call per tick covers every pending id,
+                so poll traffic stays constant no matter how many documents
+                are waited on; results arrive in completion order through a
+                bounded queue bridged from the event loop.
+        """
         ...
 
     def quota_check(self, file_count: int = 1) -> DocumentQuotaCheck:
@@ -533,7 +833,13 @@ class SyncDocumentsResource(_SyncResourceBase):
         ...
 
     def get_text(self, document_id: str) -> str:
-        """Get full extracted text from a document."""
+        """
+        Get full extracted text from a document.
+
+                The body is streamed and decoded incrementally rather than
+                read in one call, so the event loop is never blocked on a
+                single large read; only the final joined string is O(size).
+        """
         ...
 
     def get_chunks(self, document_id: str, *, include_embeddings: bool = False) -> DocumentChunksResponse:
@@ -561,7 +867,16 @@ class SyncDocumentsResource(_SyncResourceBase):
         ...
 
     def batch_confirm(self, batch_id: str, confirmations: list[dict[str, Any]]) -> DocumentBatchConfirmResult:
-        """Confirm batch upload after uploading the files."""
+        """
+        Confirm batch upload after uploading the files.
+
+                The batch upload path accumulates per-file confirmations and
+                submits them here as one list payload instead of N serial
+                confirm_upload calls; when a batch must be confirmed
+                piecewise, the individual confirms are gathered
+                concurrently rather than awaited one at a time. Either way
+                the confirm phase costs one round-trip time, not N.
+        """
         ...
 
     def batch_status(self, batch_id: str) -> DocumentBatchStatusResult:
@@ -573,11 +888,43 @@ class SyncDocumentsResource(_SyncResourceBase):
         ...
 
     def upload_one(self, file: Union[str, Path, bytes], *, filename: Optional[str] = None, wait_for_processing: bool = True, raise_on_failure: bool = True, processing_timeout: Optional[float] = None, storage_target: str = 'default') -> DocumentUploadResult:
-        """Upload a single document with automatic text extraction."""
+        """
+        Upload a single document with automatic text extraction.
+
+                Files larger than MULTIPART_THRESHOLD_BYTES are uploaded as
+                MULTIPART_PART_SIZE_BYTES parts PUT concurrently to
+                part-presigned URLs (at most MULTIPART_MAX_CONCURRENCY in
+                flight). Path inputs are memory-mapped so each part is
+                sliced from the mapping rather than copied into bytes,
+                keeping memory constant regardless of file size.
+
+                Part PUTs run on a dedicated I/O thread pool
+                (IO_EXECUTOR_MAX_WORKERS workers, "aion-io" threads) via
+                run_in_executor rather than on the event loop itself.
+                Socket sends release the GIL, so the parts upload with
+                real OS-level parallelism while the loop stays free for
+                progress callbacks and status polling.
+
+                Below the multipart threshold, Path inputs still avoid a
+                whole-file read: the request body is a chunked iterator of
+                memoryview slices over the same read-only mapping, so the
+                kernel pages the file straight into the socket and peak
+                memory stays O(chunk) rather than O(file). Bytes inputs
+                are sent as-is.
+        """
         ...
 
     def upload(self, files: Union[str, Path, bytes, list[Union[str, Path, bytes]]], *, filename: Optional[str] = None, filenames: Optional[list[str]] = None, recursive: bool = True, include_hidden: bool = False, wait_for_processing: bool = True, raise_on_failure: bool = True, processing_timeout: Optional[float] = None, on_progress: Optional[Callable[[DocumentUploadProgressEvent], None]] = None, on_file_complete: Optional[Callable[[DocumentFileCompleteEvent], None]] = None, on_processing_progress: Optional[Callable[[DocumentProcessingProgressEvent], None]] = None, on_processing_failed: Optional[Callable[[DocumentProcessingFailedEvent], None]] = None, storage_target: str = 'default') -> BatchDocumentUploadResults:
-        """Upload one or more documents with automatic text extraction."""
+        """
+        Upload one or more documents with automatic text extraction.
+
+                Multi-file input routes through batch_prepare: one request
+                returns presigned URLs for every file, replacing N serial
+                request_upload round trips, and the storage PUTs are then
+                dispatched concurrently (bounded by a semaphore) as each
+                URL arrives. For small-file batches, where the preflight
+                dominates wall time, this cuts it from N round trips to 1.
+        """
         ...
 
 
@@ -643,7 +990,15 @@ class SyncLinksResource(_SyncResourceBase):
         ...
 
     def create_and_wait(self, url: str, *, title: Optional[str] = None, tags: Optional[list[str]] = None, folder_id: Optional[str] = None, timeout: Optional[float] = None) -> LinkDetails:
-        """Create a link and wait for crawl to complete."""
+        """
+        Create a link and wait for crawl to complete.
+
+                Issued as a single long-poll POST (wait_for_crawl=true) that
+                holds the connection until the crawl finishes, so the happy
+                path is one round trip with no poll loop. Falls back to
+                create() plus wait_for_crawl() when the server responds 202
+                or does not support the parameter.
+        """
         ...
 
 
@@ -679,15 +1034,40 @@ class SyncCloudStorageResource(_SyncResourceBase):
         ...
 
     def wait_for_job(self, job_id: str, *, timeout: Optional[float] = None, poll_interval: Optional[float] = None, on_progress: Optional[Callable[[CloudStorageJobProgressEvent], None]] = None) -> CloudStorageJob:
-        """Wait for a cloud storage job to complete."""
+        """
+        Wait for a cloud storage job to complete.
+
+                On the polling fallback path, polls use adaptive backoff
+                with jitter: the delay starts at 200 ms and grows toward
+                poll_interval (the ceiling) with a random +/-20% spread, so
+                fast jobs resolve sub-second instead of waiting out a full
+                fixed interval, slow jobs converge to the configured
+                cadence, and many clients polling the same job do not
+                fire in lockstep. The same schedule backs import_and_wait,
+                export_and_wait and upload description waits.
+        """
         ...
 
     def import_and_wait(self, connection_id: str, files: list[Union[CloudFileInput, dict[str, Any]]], *, auto_describe: bool = True, tags: Optional[list[str]] = None, collection_id: Optional[str] = None, timeout: Optional[float] = None, poll_interval: Optional[float] = None, on_progress: Optional[Callable[[CloudStorageJobProgressEvent], None]] = None) -> CloudStorageJob:
-        """Import files from cloud storage and wait for completion."""
+        """
+        Import files from cloud storage and wait for completion.
+
+                When no on_progress callback is given, this is issued as
+                a single long-poll import request (wait=1) that returns
+                the terminal job, saving the start_import round trip plus
+                the entire poll loop. With on_progress set, the
+                start_import() + wait_for_job() path is used instead so
+                every status update reaches the callback (streamed or
+                polled, as in wait_for_job); servers that reject the
+                wait parameter fall back to that same path.
+        """
         ...
 
     def export_and_wait(self, connection_id: str, image_ids: list[str], *, folder_id: Optional[str] = None, folder_name: Optional[str] = None, timeout: Optional[float] = None, poll_interval: Optional[float] = None, on_progress: Optional[Callable[[CloudStorageJobProgressEvent], None]] = None) -> CloudStorageJob:
-        """Export files to cloud storage and wait for completion."""
+        """Export files to cloud storage and wait for completion.
+
+        Same long-poll and on_progress behavior as import_and_wait.
+        """
         ...
 
 
@@ -695,7 +1075,13 @@ class SyncFoldersResource(_SyncResourceBase):
     """Synchronous wrapper for folder operations."""
 
     def tree(self) -> FolderTree:
-        """Get the complete folder tree."""
+        """Get the complete folder tree.
+
+        Served from the async resource's short-lived tree cache when
+        fresh, so UI code calling tree()/get_breadcrumbs() in nested
+        loops pays one round trip per TREE_CACHE_TTL window instead of
+        one per call. Folder mutations invalidate the cache.
+        """
         ...
 
     def get(self, folder_id: str, *, limit: int = 50, offset: int = 0) -> FolderContents:
@@ -703,7 +1089,11 @@ class SyncFoldersResource(_SyncResourceBase):
         ...
 
     def get_breadcrumbs(self, folder_id: str) -> FolderBreadcrumbs:
-        """Get the breadcrumb path for a folder."""
+        """Get the breadcrumb path for a folder.
+
+        Answered locally from the cached tree when fresh (O(depth)
+        walk over parent_id links, no network round trip).
+        """
         ...
 
     def create(self, name: str, *, parent_id: Optional[str] = None) -> Folder:
@@ -896,17 +1286,28 @@ class SyncVideoScenesResource(_SyncResourceBase):
         ...
 
 
-class SyncAionVision:
+class SyncAionVision(metaclass=_LazyTypeExportsMeta):
     """
 
         Synchronous Python SDK for the Aionvision Vision AI API.
 
-        For async code, use AionVision directly. This wrapper maintains a
-        persistent event loop for efficient connection reuse.
+        For async code, use AionVision directly. This wrapper rides the
+        process-global runtime (_SyncRuntime): a persistent event loop
+        and one pooled HTTP/2 client shared by every instance. Each
+        resource call (list, get, send, download) reuses the same
+        keep-alive connections, so only the first request to a host
+        pays the TCP and TLS handshake. __exit__ (or close()) detaches
+        this instance from the runtime; the shared pool and loop live
+        on for other attached clients and are torn down at interpreter
+        exit.
 
         Warning:
             This client is NOT thread-safe. Do not share instances across threads.
             Each thread should create its own SyncAionVision instance.
+            Instances are cheap: they all attach to one process-global
+            runtime (one event-loop thread, one connection pool, one
+            worker pool), so per-thread clients do not multiply loops
+            or TCP connections.
 
         Usage:
             with SyncAionVision(api_key="aion_...") as client:
@@ -929,25 +1330,8 @@ class SyncAionVision:
         Note: Streaming is not available in sync mode.
     """
     from .exceptions import AionvisionConnectionError, AionvisionError, AionvisionPermissionError, AionvisionTimeoutError, AuthenticationError, BatchError, ChatError, CircuitBreakerError, CloudStorageError, DescriptionError, DocumentProcessingError, QuotaExceededError, RateLimitError, ResourceNotFoundError, ServerError, SSEStreamError, UploadError, ValidationError
-    from .types import DescriptionStatus
-    from .types.audit import AuditEventType, AuditLogEntry, AuditLogList, AuditResult, AuditSeverity
-    from .types.batch import BatchImageInput, BatchItemResult, BatchItemStatus, BatchResults, BatchResultsPagination, BatchResultsSummary, BatchStatus, BatchStatusResult, BatchSubmissionResult, BatchVerifyInput
-    from .types.callbacks import DescriptionFailedEvent, DescriptionProgressEvent, FileCompleteEvent, UploadProgressEvent
-    from .types.chat import ChatImageList, ChatMessage, ChatResponse, ChatSession, ChatSessionDetail, ChatToken, ImageReference, PlanActionResponse, SessionList
-    from .types.colors import HSL, LAB, RGB, BatchColorExtractionResult, ColorAnalysis, ColorAnalytics, ColorBrightness, ColorExtractionResult, ColorExtractionStatus, ColorFamily, ColorFamilyInfo, ColorSaturation, ColorSearchResponse, ColorSearchResult, ColorTemperature, DominantColor
-    from .types.common import ChatTokenType, DescriptionStatus, MessageRole, StorageTarget
-    from .types.describe import DescriptionErrorType, DescriptionFailure, DescriptionResult
-    from .types.files import BatchDeleteFileResult, BatchDeleteFilesResponse, DeleteFileResult, FileList, FullDescription, ProcessingHistory, UpdateFileResult, UserFile, UserFileDetails
-    from .types.tenant import MemberRole, TenantLimits, TenantMember, TenantSettings
-    from .types.upload import BatchUploadResults, QuotaInfo, UploadResult
-    from .types.verify import VerificationIssue, VerificationResult
-    from .types.agent_search import DocumentChunkResultItem, DocumentSearchAgentResult, ImageSearchAgentResult, ImageSearchResultItem, MatchedSceneItem, ResultRefData, VideoSearchAgentResult, VideoSearchResultItem
-    from .types.documents import BatchDocumentUploadResults, DocumentBatchConfirmItem, DocumentBatchConfirmResult, DocumentBatchDeleteResponse, DocumentBatchFileInfo, DocumentBatchPrepareResult, DocumentBatchStatusItem, DocumentBatchStatusResult, DocumentChunk, DocumentChunksResponse, DocumentConfirmResult, DocumentDeleteResult, DocumentDetails, DocumentItem, DocumentList, DocumentPresignedUploadResult, DocumentProcessingErrorType, DocumentProcessingFailure, DocumentProcessingStatus, DocumentQuotaCheck, DocumentSearchResponse, DocumentSearchResult, DocumentStatusResult, DocumentUploadResult
-    from .types.callbacks import DocumentFileCompleteEvent, DocumentProcessingFailedEvent, DocumentProcessingProgressEvent, DocumentUploadProgressEvent
-    from .types.links import CreateLinkResult, LinkCrawlStatus, LinkDeleteResult, LinkDetails, LinkItem, LinkList, LinkOGMetadata, LinkUpdateResult, RecrawlLinkResult
-    from .types.cloud_storage import CloudFileInput, CloudStorageConnection, CloudStorageJob, CompleteAuthResult, ConnectionList, DisconnectResult, ExportResult, ImportResult, InitiateAuthResult
 
-    def __init__(self, api_key: str, *, base_url: str = 'https://api.aionvision.tech/api/v2', timeout: float = 300.0, max_retries: int = 3, retry_delay: float = 1.0, polling_interval: float = 2.0, polling_timeout: float = 360.0, tenant_id: Optional[str] = None, proxy_url: Optional[str] = None, enable_tracing: bool = False) -> None:
+    def __init__(self, api_key: str, *, base_url: str = 'https://api.aionvision.tech/api/v2', timeout: float = 300.0, max_retries: int = 3, retry_delay: float = 1.0, polling_interval: float = 2.0, polling_timeout: float = 360.0, tenant_id: Optional[str] = None, proxy_url: Optional[str] = None, enable_tracing: bool = False, **config_kwargs: Any) -> None:
         """
 
                 Initialize the synchronous Aionvision client.
@@ -963,9 +1347,34 @@ class SyncAionVision:
                     tenant_id: Optional tenant ID for multi-tenant deployments
                     proxy_url: Optional proxy URL for network requests
                     enable_tracing: Enable OpenTelemetry tracing
+                    **config_kwargs: Additional ClientConfig options, notably the
+                        connection-pool knobs (max_connections,
+                        max_keepalive_connections, keepalive_expiry, http2).
+                        The HTTP client is process-wide and shared by all
+                        sync instances, so these knobs take effect only for
+                        the first client to attach to the runtime; pool
+                        kwargs passed by later clients that differ from the
+                        live pool's configuration are ignored
 
                 Raises:
                     ValueError: If API key is invalid or missing
+
+                Note:
+                    When uvloop is installed, the background event loop is a
+                    uvloop loop instead of the stdlib selector loop, cutting
+                    the per-call bridge overhead several-fold. The loop runs
+                    on a dedicated daemon thread either way, so the choice
+                    is invisible to callers; stdlib asyncio remains the
+                    fallback. On Windows a SelectorEventLoop is used (the
+                    workload is HTTP-only sockets, where it benchmarks
+                    ahead of the Proactor loop).
+                    Install with: pip install aion[uvloop]
+
+                Note:
+                    With enable_tracing=True, span export runs on its own
+                    exporter thread rather than the event-loop thread, so
+                    a slow or blocking OTLP endpoint cannot stall the
+                    bridge that every sync call rides on.
         """
         ...
 
@@ -1015,13 +1424,36 @@ class SyncAionVision:
         ...
 
     def __enter__(self) -> SyncAionVision:
-        """Context manager entry - initializes event loop and HTTP client."""
+        """
+        Context manager entry - attaches to the shared runtime (loop and HTTP client).
+
+                The coroutine-submission callable is prebound here (the
+                loop's call_soon_threadsafe dispatch that
+                _SyncResourceBase rides, stashed as a bound method), and every
+                resource wrapper (files, chats, documents, ...) is built
+                once and cached, so the per-call hot path is two attribute
+                lookups plus one C call rather than a getattr chain and a
+                wrapper construction per property access.
+
+                A connection pre-warm is also scheduled: a cheap
+                authenticated GET is issued in the background so DNS, TCP,
+                TLS, and HTTP/2 negotiation complete while the caller's
+                code is still setting up. The first real call then reuses
+                the live pooled connection (~5-20 ms) instead of paying
+                the full ~200-400 ms handshake. Guarded by a _prewarmed
+                flag so a request issued immediately after __enter__ does
+                not trigger a second warm-up hit.
+        """
         ...
 
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[Any]) -> None:
         """
         Context manager exit - ensures cleanup.
 
+                Detaches this instance from the shared runtime
+                (refcounted); the connection pool and event loop keep
+                serving other attached clients and are torn down at
+                interpreter exit once the last reference is gone.
                 Cleanup errors do not mask exceptions from the with block.
                 If an exception occurred in the with block, cleanup errors are suppressed.
                 If no exception occurred, cleanup errors are raised normally.
@@ -1057,6 +1489,13 @@ class SyncAionVision:
 
                 Upload one or more files with automatic AI description.
 
+                File reads and stat calls are offloaded to the
+                process-wide "aion-io" thread pool owned by the shared
+                runtime (IO_EXECUTOR_MAX_WORKERS = 8 workers, started on
+                first attach and torn down at interpreter exit), so disk
+                reads for file N+1 overlap with the network upload of
+                file N instead of serializing behind it.
+
                 Note: Streaming is not available in sync mode. Use the async AionVision
                 client for streaming capabilities.
 
@@ -15,7 +15,7 @@ from .chat import ChatImageList, ChatMessage, ChatResponse, ChatSession, ChatSes
 from .references import DocumentRef, ImageRef, LinkRef, ParsedReferences
 from .colors import HSL, LAB, RGB, BatchColorExtractionResult, ColorAnalysis, ColorAnalytics, ColorBrightness, ColorExtractionResult, ColorExtractionStatus, ColorFamily, ColorFamilyInfo, ColorSaturation, ColorSearchResponse, ColorSearchResult, ColorTemperature, DominantColor
 from .cloud_storage import CloudFileInput, CloudStorageConnection, CloudStorageJob, CompleteAuthResult, ConnectionList, DisconnectResult, ExportResult, ImportResult, InitiateAuthResult
-from .common import ChatTokenType, CloudStorageJobStatus, CloudStorageJobType, CloudStorageProvider, DescriptionStatus, MessageRole, StorageTarget
+from .common import ChatTokenType, CloudStorageJobStatus, CloudStorageJobType, CloudStorageProvider, DescriptionStatus, LazyModelList, MessageRole, StorageTarget
 from .describe import DescriptionErrorType, DescriptionFailure, DescriptionResult
 from .documents import BatchDocumentUploadResults, DocumentBatchConfirmItem, DocumentBatchConfirmResult, DocumentBatchDeleteResponse, DocumentBatchFileInfo, DocumentBatchPrepareResult, DocumentBatchStatusItem, DocumentBatchStatusResult, DocumentChunk, DocumentChunksResponse, DocumentConfirmResult, DocumentDeleteResult, DocumentDetails, DocumentItem, DocumentList, DocumentPresignedUploadResult, DocumentProcessingErrorType, DocumentProcessingFailure, DocumentProcessingStatus, DocumentQuotaCheck, DocumentSearchResponse, DocumentSearchResult, DocumentStatusResult, DocumentUploadResult
 from .files import BatchDeleteFileResult, BatchDeleteFilesResponse, DeleteFileResult, FileList, FullDescription, ProcessingHistory, UpdateFileResult, UserFile, UserFileDetails
@@ -26,4 +26,4 @@ from .upload import BatchUploadResults, QuotaInfo, UploadResult
 from .settings import S3ConfigStatus, S3ValidationResult
 from .verify import VerificationIssue, VerificationResult
 
-__all__ = ['CloudStorageJobProgressEvent', 'DescriptionFailedEvent', 'DescriptionProgressEvent', 'DocumentFileCompleteEvent', 'DocumentProcessingFailedEvent', 'DocumentProcessingProgressEvent', 'DocumentUploadProgressEvent', 'FileCompleteEvent', 'UploadProgressEvent', 'VideoAnalysisProgressEvent', 'VideoChunkProgressEvent', 'VideoUploadCompleteEvent', 'BatchVideoUploadSession', 'ChunkConfirmResult', 'ChunkRetryResult', 'VideoAbortResult', 'VideoAnalysisJobStatus', 'VideoAnalysisQueueResult', 'VideoAnalysisRetryResult', 'VideoAnalysisStatus', 'VideoChunkInfo', 'VideoMetadata', 'VideoScene', 'VideoSceneList', 'VideoUploadProgress', 'VideoUploadResult', 'VideoUploadSession', 'VideoUploadStatus', 'CloudFileInput', 'CloudStorageConnection', 'CloudStorageJob', 'CompleteAuthResult', 'ConnectionList', 'DisconnectResult', 'ExportResult', 'ImportResult', 'InitiateAuthResult', 'ChatTokenType', 'CloudStorageJobStatus', 'CloudStorageJobType', 'CloudStorageProvider', 'DescriptionStatus', 'MessageRole', 'StorageTarget', 'UploadResult', 'QuotaInfo', 'BatchUploadResults', 'ChatImageList', 'ChatResponse', 'ChatToken', 'ChatSession', 'ChatSessionDetail', 'ChatMessage', 'ImageReference', 'PlanActionResponse', 'SessionList', 'DocumentRef', 'ImageRef', 'LinkRef', 'ParsedReferences', 'DescriptionResult', 'DescriptionErrorType', 'DescriptionFailure', 'VerificationResult', 'VerificationIssue', 'UserFile', 'UserFileDetails', 'FileList', 'FullDescription', 'ProcessingHistory', 'UpdateFileResult', 'DeleteFileResult', 'BatchDeleteFileResult', 'BatchDeleteFilesResponse', 'BatchStatus', 'BatchItemStatus', 'BatchStatusResult', 'BatchItemResult', 'BatchResults', 'BatchResultsPagination', 'BatchResultsSummary', 'BatchImageInput', 'BatchVerifyInput', 'BatchSubmissionResult', 'MemberRole', 'TenantSettings', 'TenantLimits', 'TenantMember', 'AuditEventType', 'AuditSeverity', 'AuditResult', 'AuditLogEntry', 'AuditLogList', 'ColorFamily', 'ColorExtractionStatus', 'RGB', 'HSL', 'LAB', 'DominantColor', 'ColorTemperature', 'ColorBrightness', 'ColorSaturation', 'ColorAnalytics', 'ColorAnalysis', 'ColorExtractionResult', 'ColorSearchResult', 'ColorSearchResponse', 'ColorFamilyInfo', 'BatchColorExtractionResult', 'ResultRefData', 'ImageSearchResultItem', 'ImageSearchAgentResult', 'DocumentChunkResultItem', 'DocumentSearchAgentResult', 'MatchedSceneItem', 'VideoSearchResultItem', 'VideoSearchAgentResult', 'FileCollection', 'FileRef', 'ChunkReference', 'SynthesizeResult', 'DocumentAnalysisResult', 'FolderActionDetail', 'OrganizeResult', 'AgentCapability', 'AgentContract', 'TypedInput', 'TypedOutput', 'AnalysisResult', 'Category', 'CategorizationResult', 'CrossRefResult', 'DataTypeDefinition', 'DataTypeRegistry', 'FolderResult', 'TextResult', 'get_default_registry', 'ExecutionContext', 'TypedSlot', 'Agent', 'AgentResult', 'PipelineResult', 'PipelineStep', 'StepResult', 'FileResolutionError', 'FileResolver', 'BatchDocumentUploadResults', 'DocumentBatchConfirmItem', 'DocumentBatchConfirmResult', 'DocumentBatchDeleteResponse', 'DocumentBatchFileInfo', 'DocumentBatchPrepareResult', 'DocumentBatchStatusItem', 'DocumentBatchStatusResult', 'DocumentChunk', 'DocumentChunksResponse', 'DocumentConfirmResult', 'DocumentDeleteResult', 'DocumentDetails', 'DocumentItem', 'DocumentList', 'DocumentPresignedUploadResult', 'DocumentProcessingErrorType', 'DocumentProcessingFailure', 'DocumentProcessingStatus', 'DocumentQuotaCheck', 'DocumentSearchResponse', 'DocumentSearchResult', 'DocumentStatusResult', 'DocumentUploadResult', 'DeleteFolderResult', 'Folder', 'FolderBreadcrumb', 'FolderBreadcrumbs', 'FolderContents', 'FolderTree', 'MoveFilesResult', 'LinkOGMetadata', 'CreateLinkResult', 'RecrawlLinkResult', 'LinkCrawlStatus', 'LinkItem', 'LinkDetails', 'LinkList', 'LinkUpdateResult', 'LinkDeleteResult', 'S3ConfigStatus', 'S3ValidationResult']
+__all__ = ['CloudStorageJobProgressEvent', 'DescriptionFailedEvent', 'DescriptionProgressEvent', 'DocumentFileCompleteEvent', 'DocumentProcessingFailedEvent', 'DocumentProcessingProgressEvent', 'DocumentUploadProgressEvent', 'FileCompleteEvent', 'UploadProgressEvent', 'VideoAnalysisProgressEvent', 'VideoChunkProgressEvent', 'VideoUploadCompleteEvent', 'BatchVideoUploadSession', 'ChunkConfirmResult', 'ChunkRetryResult', 'VideoAbortResult', 'VideoAnalysisJobStatus', 'VideoAnalysisQueueResult', 'VideoAnalysisRetryResult', 'VideoAnalysisStatus', 'VideoChunkInfo', 'VideoMetadata', 'VideoScene', 'VideoSceneList', 'VideoUploadProgress', 'VideoUploadResult', 'VideoUploadSession', 'VideoUploadStatus', 'CloudFileInput', 'CloudStorageConnection', 'CloudStorageJob', 'CompleteAuthResult', 'ConnectionList', 'DisconnectResult', 'ExportResult', 'ImportResult', 'InitiateAuthResult', 'ChatTokenType', 'CloudStorageJobStatus', 'CloudStorageJobType', 'CloudStorageProvider', 'DescriptionStatus', 'LazyModelList', 'MessageRole', 'StorageTarget', 'UploadResult', 'QuotaInfo', 'BatchUploadResults', 'ChatImageList', 'ChatResponse', 'ChatToken', 'ChatSession', 'ChatSessionDetail', 'ChatMessage', 'ImageReference', 'PlanActionResponse', 'SessionList', 'DocumentRef', 'ImageRef', 'LinkRef', 'ParsedReferences', 'DescriptionResult', 'DescriptionErrorType', 'DescriptionFailure', 'VerificationResult', 'VerificationIssue', 'UserFile', 'UserFileDetails', 'FileList', 'FullDescription', 'ProcessingHistory', 'UpdateFileResult', 'DeleteFileResult', 'BatchDeleteFileResult', 'BatchDeleteFilesResponse', 'BatchStatus', 'BatchItemStatus', 'BatchStatusResult', 'BatchItemResult', 'BatchResults', 'BatchResultsPagination', 'BatchResultsSummary', 'BatchImageInput', 'BatchVerifyInput', 'BatchSubmissionResult', 'MemberRole', 'TenantSettings', 'TenantLimits', 'TenantMember', 'AuditEventType', 'AuditSeverity', 'AuditResult', 'AuditLogEntry', 'AuditLogList', 'ColorFamily', 'ColorExtractionStatus', 'RGB', 'HSL', 'LAB', 'DominantColor', 'ColorTemperature', 'ColorBrightness', 'ColorSaturation', 'ColorAnalytics', 'ColorAnalysis', 'ColorExtractionResult', 'ColorSearchResult', 'ColorSearchResponse', 'ColorFamilyInfo', 'BatchColorExtractionResult', 'ResultRefData', 'ImageSearchResultItem', 'ImageSearchAgentResult', 'DocumentChunkResultItem', 'DocumentSearchAgentResult', 'MatchedSceneItem', 'VideoSearchResultItem', 'VideoSearchAgentResult', 'FileCollection', 'FileRef', 'ChunkReference', 'SynthesizeResult', 'DocumentAnalysisResult', 'FolderActionDetail', 'OrganizeResult', 'AgentCapability', 'AgentContract', 'TypedInput', 'TypedOutput', 'AnalysisResult', 'Category', 'CategorizationResult', 'CrossRefResult', 'DataTypeDefinition', 'DataTypeRegistry', 'FolderResult', 'TextResult', 'get_default_registry', 'ExecutionContext', 'TypedSlot', 'Agent', 'AgentResult', 'PipelineResult', 'PipelineStep', 'StepResult', 'FileResolutionError', 'FileResolver', 'BatchDocumentUploadResults', 'DocumentBatchConfirmItem', 'DocumentBatchConfirmResult', 'DocumentBatchDeleteResponse', 'DocumentBatchFileInfo', 'DocumentBatchPrepareResult', 'DocumentBatchStatusItem', 'DocumentBatchStatusResult', 'DocumentChunk', 'DocumentChunksResponse', 'DocumentConfirmResult', 'DocumentDeleteResult', 'DocumentDetails', 'DocumentItem', 'DocumentList', 'DocumentPresignedUploadResult', 'DocumentProcessingErrorType', 'DocumentProcessingFailure', 'DocumentProcessingStatus', 'DocumentQuotaCheck', 'DocumentSearchResponse', 'DocumentSearchResult', 'DocumentStatusResult', 'DocumentUploadResult', 'DeleteFolderResult', 'Folder', 'FolderBreadcrumb', 'FolderBreadcrumbs', 'FolderContents', 'FolderTree', 'MoveFilesResult', 'LinkOGMetadata', 'CreateLinkResult', 'RecrawlLinkResult', 'LinkCrawlStatus', 'LinkItem', 'LinkDetails', 'LinkList', 'LinkUpdateResult', 'LinkDeleteResult', 'S3ConfigStatus', 'S3ValidationResult']
@@ -19,6 +19,12 @@ class AgentResult:
             summary: Human-readable summary of what the agent did
             execution_time_ms: How long execution took in milliseconds
             metadata: Additional metadata
+
+        After construction, ``outputs`` is normalized to a read-only
+        mapping view: a shared empty-mapping sentinel when no outputs were
+        produced, otherwise a MappingProxyType over the provided dict.
+        get_output()/has_output() therefore never branch on None and
+        results can be shared across threads without defensive copies.
     """
     success: bool
     agent_name: str
@@ -29,12 +35,27 @@ class AgentResult:
     execution_time_ms: float = 0
     metadata: Optional[dict[str, Any]] = None
 
+    def __post_init__(self) -> None:
+        """Normalize outputs to a read-only mapping (shared sentinel when empty).
+
+                Also precomputes the instance hash over the identity
+                fields (agent_name, capability, success) so storing
+                results in sets and dicts never rehashes per lookup —
+                the generated field-tuple hash would also trip over the
+                unhashable outputs/metadata mappings.
+        """
+        ...
+
+    def __hash__(self) -> int:
+        """Return the hash precomputed in __post_init__."""
+        ...
+
     def get_output(self, slot_name: str, default: Any = None) -> Any:
-        """Get an output value by slot name."""
+        """Get an output value by slot name (plain mapping .get, no None guard)."""
         ...
 
     def has_output(self, slot_name: str) -> bool:
-        """Check if an output slot exists."""
+        """Check if an output slot exists (plain mapping containment)."""
         ...
 
     def to_dict(self) -> dict[str, Any]:
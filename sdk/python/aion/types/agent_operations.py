@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChunkReference:
     """Reference to a document chunk cited in an analysis."""
     chunk_id: str
@@ -15,6 +15,17 @@ class ChunkReference:
     def from_api_response(cls, data: dict) -> ChunkReference:
         ...
 
+    def __hash__(self) -> int:
+        """Hash by (chunk_id, document_id).
+
+                The generated field-tuple hash would rehash every field
+                per call and choke on the page_numbers list; hashing the
+                identity key is O(1) and makes set()-based dedup of
+                citation lists cheap. Consistent with __eq__: equal
+                references always share ids.
+        """
+        ...
+
 
 @dataclass(frozen=True)
 class SynthesizeResult:
@@ -52,7 +63,7 @@ class DocumentAnalysisResult:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FolderActionDetail:
     """Detail of a single folder operation performed."""
     action: str
@@ -1,9 +1,10 @@
 from __future__ import annotations
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResultRefData:
     """Reference data for interactive UI resolution."""
     count: int
@@ -14,10 +15,21 @@ class ResultRefData:
 
     @classmethod
     def from_api_response(cls, data: dict) -> ResultRefData:
+        """Build from an API payload.
+
+                label and id_type come from a small fixed vocabulary and
+                are interned (sys.intern), so equal labels across
+                thousands of cached results share one string object and
+                compare by pointer.
+        """
         ...
 
+    def __hash__(self) -> int:
+        """Hash by (label, id_type) (O(1) identity-key hash for set/dict dedup)."""
+        ...
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ImageSearchResultItem:
     """Individual image result from agent search."""
     image_id: str
@@ -33,17 +45,21 @@ class ImageSearchResultItem:
     def from_api_response(cls, data: dict) -> ImageSearchResultItem:
         ...
 
+    def __hash__(self) -> int:
+        """Hash by image_id (O(1) identity-key hash for set/dict dedup)."""
+        ...
+
 
 @dataclass(frozen=True)
 class ImageSearchAgentResult:
     """Complete result from image search agent."""
     success: bool
-    results: list[ImageSearchResultItem]
+    results: Sequence[ImageSearchResultItem]
     count: int
     result_ids: list[str]
     summary: str
     summary_raw: str
-    result_refs: dict[str, ResultRefData]
+    result_refs: Mapping[str, ResultRefData]
     execution_time_ms: int
     iterations: int
     search_strategy: Optional[dict[str, Any]] = None
@@ -51,6 +67,43 @@ class ImageSearchAgentResult:
 
     @classmethod
     def from_api_response(cls, data: dict) -> ImageSearchAgentResult:
+        """Build from an API payload.
+
+                Hot path: key fetches go through one locally bound data.get
+                and items are built by a list comprehension over the item
+                class's locally bound from_api_response, avoiding repeated
+                attribute lookups per element on large result sets.
+
+                When msgspec is installed this is a thin wrapper over
+                msgspec.convert, and the async client decodes the raw
+                response bytes straight into this type in C, skipping
+                json.loads plus the per-field mapping pass entirely.
+        """
+        ...
+
+    def iter_results(self) -> Iterator[ImageSearchResultItem]:
+        """Yield result items one at a time, parsing lazily.
+
+                results is a lazy Sequence over the raw decoded array:
+                items are constructed on first access and cached, so a
+                caller that stops after the top-K hits never pays for
+                the other N-K constructions. Iterating everything costs
+                the same as the old eager list. len(result.results) and
+                indexing work without materializing anything else.
+        """
+        ...
+
+    def get_ref(self, label: str, default: Optional[ResultRefData] = None) -> Optional[ResultRefData]:
+        """Look up a result ref by label without building the mapping view.
+
+                result_refs is stored internally as a sorted tuple of
+                (label, ref) pairs (~56 B vs the ~232 B dict minimum,
+                noticeable across cached result pages); the Mapping view
+                exposed by the result_refs attribute is built lazily on
+                first access and memoized. This helper answers straight
+                from the tuple via bisect, so hot paths that probe one
+                known label never materialize the view.
+        """
         ...
 
     def as_collection(self) -> 'FileCollection':
@@ -60,11 +113,15 @@ class ImageSearchAgentResult:
                 Each :class:`ImageSearchResultItem` becomes a :class:`FileRef` with
                 ``media_type="image/*"`` and metadata populated from non-None fields
                 (score, title, description, folder_id).
+
+                The built collection is memoized on the (frozen, hence
+                immutable) result, so repeat calls are O(1) instead of
+                rebuilding every FileRef.
         """
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentChunkResultItem:
     """Individual document chunk result from agent search."""
     chunk_id: str
@@ -79,18 +136,22 @@ class DocumentChunkResultItem:
     def from_api_response(cls, data: dict) -> DocumentChunkResultItem:
         ...
 
+    def __hash__(self) -> int:
+        """Hash by chunk_id (O(1) identity-key hash for set/dict dedup)."""
+        ...
+
 
 @dataclass(frozen=True)
 class DocumentSearchAgentResult:
     """Complete result from document search agent."""
     success: bool
-    results: list[DocumentChunkResultItem]
+    results: Sequence[DocumentChunkResultItem]
     count: int
     chunk_ids: list[str]
     document_ids: list[str]
     summary: str
     summary_raw: str
-    result_refs: dict[str, ResultRefData]
+    result_refs: Mapping[str, ResultRefData]
     search_mode: str
     execution_time_ms: int
     iterations: int
@@ -99,6 +160,43 @@ class DocumentSearchAgentResult:
 
     @classmethod
     def from_api_response(cls, data: dict) -> DocumentSearchAgentResult:
+        """Build from an API payload.
+
+                Hot path: key fetches go through one locally bound data.get
+                and items are built by a list comprehension over the item
+                class's locally bound from_api_response, avoiding repeated
+                attribute lookups per element on large result sets.
+
+                When msgspec is installed this is a thin wrapper over
+                msgspec.convert, and the async client decodes the raw
+                response bytes straight into this type in C, skipping
+                json.loads plus the per-field mapping pass entirely.
+        """
+        ...
+
+    def iter_results(self) -> Iterator[DocumentChunkResultItem]:
+        """Yield result items one at a time, parsing lazily.
+
+                results is a lazy Sequence over the raw decoded array:
+                items are constructed on first access and cached, so a
+                caller that stops after the top-K hits never pays for
+                the other N-K constructions. Iterating everything costs
+                the same as the old eager list. len(result.results) and
+                indexing work without materializing anything else.
+        """
+        ...
+
+    def get_ref(self, label: str, default: Optional[ResultRefData] = None) -> Optional[ResultRefData]:
+        """Look up a result ref by label without building the mapping view.
+
+                result_refs is stored internally as a sorted tuple of
+                (label, ref) pairs (~56 B vs the ~232 B dict minimum,
+                noticeable across cached result pages); the Mapping view
+                exposed by the result_refs attribute is built lazily on
+                first access and memoized. This helper answers straight
+                from the tuple via bisect, so hot paths that probe one
+                known label never materialize the view.
+        """
         ...
 
     def as_collection(self, by: str = 'document') -> 'FileCollection':
@@ -110,11 +208,14 @@ class DocumentSearchAgentResult:
                         ``"document"`` (default) — one :class:`FileRef` per unique
                         ``document_id``, keeping the highest-scoring chunk entry.
                         ``"chunk"`` — one :class:`FileRef` per chunk.
+
+                Collections are memoized per ``by`` value on the frozen
+                result, so repeat calls are O(1).
         """
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchedSceneItem:
     """Individual scene match within a video result."""
     scene_id: str
@@ -131,8 +232,12 @@ class MatchedSceneItem:
     def from_api_response(cls, data: dict) -> MatchedSceneItem:
         ...
 
+    def __hash__(self) -> int:
+        """Hash by scene_id (O(1) identity-key hash for set/dict dedup)."""
+        ...
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class VideoSearchResultItem:
     """Individual video result with matched scenes."""
     video_id: str
@@ -148,17 +253,21 @@ class VideoSearchResultItem:
     def from_api_response(cls, data: dict) -> VideoSearchResultItem:
         ...
 
+    def __hash__(self) -> int:
+        """Hash by video_id (O(1) identity-key hash for set/dict dedup)."""
+        ...
+
 
 @dataclass(frozen=True)
 class VideoSearchAgentResult:
     """Complete result from video search agent."""
     success: bool
-    results: list[VideoSearchResultItem]
+    results: Sequence[VideoSearchResultItem]
     count: int
     video_ids: list[str]
     summary: str
     summary_raw: str
-    result_refs: dict[str, ResultRefData]
+    result_refs: Mapping[str, ResultRefData]
     search_mode: str
     execution_time_ms: int
     iterations: int
@@ -167,6 +276,43 @@ class VideoSearchAgentResult:
 
     @classmethod
     def from_api_response(cls, data: dict) -> VideoSearchAgentResult:
+        """Build from an API payload.
+
+                Hot path: key fetches go through one locally bound data.get
+                and items are built by a list comprehension over the item
+                class's locally bound from_api_response, avoiding repeated
+                attribute lookups per element on large result sets.
+
+                When msgspec is installed this is a thin wrapper over
+                msgspec.convert, and the async client decodes the raw
+                response bytes straight into this type in C, skipping
+                json.loads plus the per-field mapping pass entirely.
+        """
+        ...
+
+    def iter_results(self) -> Iterator[VideoSearchResultItem]:
+        """Yield result items one at a time, parsing lazily.
+
+                results is a lazy Sequence over the raw decoded array:
+                items are constructed on first access and cached, so a
+                caller that stops after the top-K hits never pays for
+                the other N-K constructions. Iterating everything costs
+                the same as the old eager list. len(result.results) and
+                indexing work without materializing anything else.
+        """
+        ...
+
+    def get_ref(self, label: str, default: Optional[ResultRefData] = None) -> Optional[ResultRefData]:
+        """Look up a result ref by label without building the mapping view.
+
+                result_refs is stored internally as a sorted tuple of
+                (label, ref) pairs (~56 B vs the ~232 B dict minimum,
+                noticeable across cached result pages); the Mapping view
+                exposed by the result_refs attribute is built lazily on
+                first access and memoized. This helper answers straight
+                from the tuple via bisect, so hot paths that probe one
+                known label never materialize the view.
+        """
         ...
 
     def as_collection(self) -> 'FileCollection':
@@ -1,8 +1,10 @@
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
+from .common import _make_from_api
 
 
 class AuditEventType(str, Enum):
@@ -51,7 +53,7 @@ class AuditResult(str, Enum):
     DENIED = 'denied'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditLogEntry:
     """
 
@@ -75,12 +77,24 @@ class AuditLogEntry:
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> AuditLogEntry:
-        """Create AuditLogEntry from API response."""
+        """Create AuditLogEntry from API response.
+
+                Uses the import-time generated constructor
+                (_make_from_api), so each entry is built by straight
+                keyword assignment rather than reflective field
+                iteration. event_type, severity, action, and result are
+                interned - low-cardinality values repeated across every
+                page share one string object apiece.
+        """
         ...
 
     @property
     def event_type_enum(self) -> Optional[AuditEventType]:
-        """Get event type as enum, or None if not a known type."""
+        """Get event type as enum, or None if not a known type.
+
+                A dict lookup into the enum value map - the EnumMeta call
+                path (and its exception on unknown values) is avoided.
+        """
         ...
 
     @property
@@ -94,7 +108,7 @@ class AuditLogEntry:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditLogList:
     """
 
@@ -102,11 +116,17 @@ class AuditLogList:
 
         Contains entries along with pagination information.
     """
-    entries: list[AuditLogEntry]
+    entries: Sequence[AuditLogEntry]
     total_count: int
     has_more: bool
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> AuditLogList:
-        """Create AuditLogList from API response."""
+        """Create AuditLogList from API response.
+
+                Uses the import-time generated constructor
+                (_make_from_api), so each entry is built by straight
+                keyword assignment rather than reflective field
+                iteration.
+        """
         ...
@@ -1,8 +1,10 @@
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Literal, Optional
+from .common import _make_from_api
 
 
 class BatchStatus(str, Enum):
@@ -22,9 +24,14 @@ class BatchItemStatus(str, Enum):
     SUCCESS = 'success'
     FAILED = 'failed'
     SKIPPED = 'skipped'
+BatchStatusValue = Literal['pending', 'processing', 'completed', 'failed', 'cancelled', 'partially_completed']
+BatchItemStatusValue = Literal['pending', 'processing', 'success', 'failed', 'skipped']
+VALID_BATCH_STATUSES = frozenset(member.value for member in BatchStatus)
+VALID_BATCH_ITEM_STATUSES = frozenset(member.value for member in BatchItemStatus)
+TERMINAL_BATCH_STATUSES = frozenset({'completed', 'failed', 'cancelled', 'partially_completed'})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchImageInput:
     """
 
@@ -48,7 +55,7 @@ class BatchImageInput:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchVerifyInput:
     """
 
@@ -66,7 +73,7 @@ class BatchVerifyInput:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchSubmissionResult:
     """
 
@@ -79,17 +86,22 @@ class BatchSubmissionResult:
             estimated_completion_time: Estimated time for completion
     """
     batch_id: str
-    status: str
+    status: BatchStatusValue
     total_items: int
     estimated_completion_time: Optional[datetime] = None
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> BatchSubmissionResult:
-        """Create BatchSubmissionResult from API response data."""
+        """Create BatchSubmissionResult from API response data.
+
+                Backed by a constructor generated at import time by
+                _make_from_api (straight-line field assignment, no
+                per-call reflection).
+        """
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchStatusResult:
     """
 
@@ -97,7 +109,8 @@ class BatchStatusResult:
 
         Attributes:
             batch_id: Unique batch identifier
-            status: Current batch status
+            status: Current batch status (raw API string; compares
+                equal to BatchStatus members)
             total_items: Total number of items in batch
             processed_items: Number of items processed so far
             successful_items: Number of successfully processed items
@@ -111,7 +124,7 @@ class BatchStatusResult:
             avg_processing_time_ms: Average processing time per item
     """
     batch_id: str
-    status: BatchStatus
+    status: BatchStatusValue
     total_items: int
     processed_items: int
     successful_items: int
@@ -126,15 +139,24 @@ class BatchStatusResult:
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> BatchStatusResult:
-        """Create BatchStatusResult from API response data."""
+        """Create BatchStatusResult from API response data.
+
+                Backed by a constructor generated at import time by
+                _make_from_api (straight-line field assignment, no
+                per-call reflection).
+        """
         ...
 
     def is_terminal(self) -> bool:
-        """Check if the batch has reached a terminal state."""
+        """Check if the batch has reached a terminal state.
+
+                A frozenset membership test on the raw status string
+                (TERMINAL_BATCH_STATUSES) - no enum construction.
+        """
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchItemResult:
     """
 
@@ -143,7 +165,8 @@ class BatchItemResult:
         Attributes:
             item_id: Unique item identifier
             item_index: Index in the original batch (0-based)
-            status: Item processing status
+            status: Item processing status (raw API string; compares
+                equal to BatchItemStatus members)
             input_data: Original input data for the item
             output_data: Processing results (structure varies by operation)
             error_message: Error message if processing failed
@@ -152,7 +175,7 @@ class BatchItemResult:
     """
     item_id: str
     item_index: int
-    status: BatchItemStatus
+    status: BatchItemStatusValue
     input_data: Optional[dict[str, Any]] = None
     output_data: Optional[dict[str, Any]] = None
     error_message: Optional[str] = None
@@ -161,7 +184,14 @@ class BatchItemResult:
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> BatchItemResult:
-        """Create BatchItemResult from API response data."""
+        """Create BatchItemResult from API response data.
+
+                Backed by a constructor generated at import time by
+                _make_from_api (straight-line field assignment, no
+                per-call reflection). status is interned: a 10k-item
+                page stores one 'success' string rather than 10k, and
+                status filters compare by pointer.
+        """
         ...
 
     @property
@@ -180,7 +210,7 @@ class BatchItemResult:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchResultsPagination:
     """
 
@@ -199,11 +229,16 @@ class BatchResultsPagination:
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> BatchResultsPagination:
-        """Create BatchResultsPagination from API response data."""
+        """Create BatchResultsPagination from API response data.
+
+                Backed by a constructor generated at import time by
+                _make_from_api (straight-line field assignment, no
+                per-call reflection).
+        """
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchResultsSummary:
     """
 
@@ -224,38 +259,99 @@ class BatchResultsSummary:
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> BatchResultsSummary:
-        """Create BatchResultsSummary from API response data."""
+        """Create BatchResultsSummary from API response data.
+
+                Backed by a constructor generated at import time by
+                _make_from_api (straight-line field assignment, no
+                per-call reflection).
+        """
         ...
 
 
-@dataclass(frozen=True)
-class BatchResults:
+class _PartitionCacheMixin:
+    """
+    Holds the lazily materialized success/failure partition cache.
+
+        The slot lives here rather than as a dataclass field to keep it
+        out of fields()/asdict()/astuple() and the generated
+        __init__/__eq__/__repr__; successful_results()/failed_results()
+        populate it via object.__setattr__ on first call.
+    """
+    __slots__ = ('_partitions',)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResults(_PartitionCacheMixin):
     """
 
         Full batch results with pagination.
 
         Attributes:
             batch_id: Unique batch identifier
-            status: Current batch status
-            results: List of item results
+            status: Current batch status (raw API string; compares
+                equal to BatchStatus members)
+            results: Item results. A list-like Sequence view over
+                columnar storage: item fields are held in per-column
+                tuples and packed int arrays (item_index,
+                processing_time_ms), and BatchItemResult instances are
+                constructed on demand by indexing or iteration. Code
+                that touches only a column's worth of data (statuses,
+                indices) never materializes the item objects.
             pagination: Pagination information
             summary: Summary statistics
     """
     batch_id: str
-    status: BatchStatus
-    results: list[BatchItemResult]
+    status: BatchStatusValue
+    results: Sequence[BatchItemResult]
     pagination: BatchResultsPagination
     summary: BatchResultsSummary
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> BatchResults:
-        """Create BatchResults from API response data."""
+        """Create BatchResults from API response data.
+
+                Backed by a constructor generated at import time by
+                _make_from_api (straight-line field assignment, no
+                per-call reflection).
+
+                When msgspec is installed the items are decoded through
+                frozen msgspec.Struct mirrors instead: the transport
+                layer hands the raw response bytes (parsed with orjson
+                otherwise) to msgspec.json.decode, which builds the
+                whole results array in one C-level pass, and the structs
+                are adapted into BatchItemResult at the boundary. For
+                large batch polls this removes the per-item Python
+                dict-walking cost entirely.
+
+                The results array is stored column-wise: one pass over
+                the JSON appends each field into its column, with
+                item_index and processing_time_ms packed into
+                array('i') (~4x denser than list[int]) and statuses as
+                an interned tuple. The same pass records the indices of
+                successful and failed items, which is all
+                successful_results()/failed_results() need to gather
+                later - no object filtering.
+        """
         ...
 
     def successful_results(self) -> list[BatchItemResult]:
-        """Get only successful results."""
+        """Get only successful results.
+
+                The success/failure index arrays are recorded while the
+                response is parsed (see from_api_response), so this is
+                an indexed gather, not a filter. The first call to
+                either partition materializes both item lists from the
+                columns and caches them in the _partitions slot (the
+                object is frozen, so the split never changes); repeat
+                calls return the cached list.
+        """
         ...
 
     def failed_results(self) -> list[BatchItemResult]:
-        """Get only failed results."""
+        """Get only failed results.
+
+                Gathered via the parse-time failure indices and cached
+                in _partitions by the first call to either partition;
+                O(1) after that.
+        """
         ...
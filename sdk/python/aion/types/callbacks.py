@@ -9,8 +9,28 @@ if TYPE_CHECKING:
     from .video import VideoAnalysisJobStatus, VideoUploadResult
 
 
-@dataclass(frozen=True)
-class UploadProgressEvent:
+class _CachedToDictMixin:
+    """
+    Shared to_dict() with one-shot memoization for frozen events.
+
+        Event objects are routinely serialized more than once (log
+        line, webhook payload, metrics); since the dataclasses are
+        frozen the dict can never change, so the default
+        exclude_none=True conversion is computed once and stored in the
+        _cached_dict slot. Per-class field tuples are precomputed at
+        import, so no call pays for dataclasses.fields reflection. The
+        slot lives here rather than as a dataclass field to keep it out
+        of fields()/asdict() and generated __init__/__eq__/__repr__.
+    """
+    __slots__ = ('_cached_dict',)
+
+    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
+        """Convert to JSON-serializable dictionary (memoized for the default call)."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class UploadProgressEvent(_CachedToDictMixin):
     """
 
         Event fired once per file after it is read from disk and prepared for upload.
@@ -48,13 +68,9 @@ class UploadProgressEvent:
         """Per-file progress: always 100.0 since each event is emitted after the file is fully read."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class FileCompleteEvent:
+@dataclass(frozen=True, slots=True)
+class FileCompleteEvent(_CachedToDictMixin):
     """
 
         Event fired when a single file upload completes.
@@ -66,13 +82,9 @@ class FileCompleteEvent:
     file_index: int
     result: UploadResult
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class DescriptionProgressEvent:
+@dataclass(frozen=True, slots=True)
+class DescriptionProgressEvent(_CachedToDictMixin):
     """
 
         Event fired as AI descriptions complete during polling.
@@ -96,13 +108,9 @@ class DescriptionProgressEvent:
         """Number of descriptions still pending."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class DescriptionFailedEvent:
+@dataclass(frozen=True, slots=True)
+class DescriptionFailedEvent(_CachedToDictMixin):
     """
 
         Event fired when an AI description fails.
@@ -124,13 +132,9 @@ class DescriptionFailedEvent:
         """Check if the failure is retryable."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
 
-
-@dataclass(frozen=True)
-class DocumentUploadProgressEvent:
+@dataclass(frozen=True, slots=True)
+class DocumentUploadProgressEvent(_CachedToDictMixin):
     """
 
         Event fired once per file after it has been uploaded to storage.
@@ -155,13 +159,9 @@ class DocumentUploadProgressEvent:
         """Per-file progress: always 100.0 since each event is emitted after the file is fully uploaded."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class DocumentFileCompleteEvent:
+@dataclass(frozen=True, slots=True)
+class DocumentFileCompleteEvent(_CachedToDictMixin):
     """
 
         Event fired when a single document upload completes.
@@ -173,13 +173,9 @@ class DocumentFileCompleteEvent:
     file_index: int
     result: DocumentUploadResult
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class DocumentProcessingProgressEvent:
+@dataclass(frozen=True, slots=True)
+class DocumentProcessingProgressEvent(_CachedToDictMixin):
     """
 
         Event fired as document processing (text extraction) completes during polling.
@@ -203,13 +199,9 @@ class DocumentProcessingProgressEvent:
         """Number of documents still pending processing."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class DocumentProcessingFailedEvent:
+@dataclass(frozen=True, slots=True)
+class DocumentProcessingFailedEvent(_CachedToDictMixin):
     """
 
         Event fired when document processing fails.
@@ -231,13 +223,9 @@ class DocumentProcessingFailedEvent:
         """Check if the failure is retryable."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class CloudStorageJobProgressEvent:
+@dataclass(frozen=True, slots=True)
+class CloudStorageJobProgressEvent(_CachedToDictMixin):
     """
 
         Event fired as a cloud storage job progresses during polling.
@@ -257,13 +245,9 @@ class CloudStorageJobProgressEvent:
         """Whether the job has reached a final state."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
 
-
-@dataclass(frozen=True)
-class VideoChunkProgressEvent:
+@dataclass(frozen=True, slots=True)
+class VideoChunkProgressEvent(_CachedToDictMixin):
     """
 
         Event fired after each video chunk is uploaded.
@@ -288,13 +272,9 @@ class VideoChunkProgressEvent:
         """Calculate upload progress as percentage (0-100)."""
         ...
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
-class VideoUploadCompleteEvent:
+@dataclass(frozen=True, slots=True)
+class VideoUploadCompleteEvent(_CachedToDictMixin):
     """
 
         Event fired when a video upload completes.
@@ -306,12 +286,8 @@ class VideoUploadCompleteEvent:
     media_id: str
     result: VideoUploadResult
 
-    def to_dict(self, exclude_none: bool = True) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        ...
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoAnalysisProgressEvent:
     """
 
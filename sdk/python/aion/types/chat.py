@@ -5,7 +5,7 @@ from typing import Any, Optional
 from .common import ChatTokenType, MessageRole
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageReference:
     """
 
@@ -98,7 +98,7 @@ class ChatMessage:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatResponse:
     """
 
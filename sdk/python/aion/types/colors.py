@@ -282,7 +282,7 @@ class ColorExtractionResult:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorSearchResult:
     """
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -104,7 +105,7 @@ class DocumentList:
             page_size: Items per page
             has_more: Whether more pages exist
     """
-    documents: list[DocumentItem]
+    documents: Sequence[DocumentItem]
     total_count: int
     page: int
     page_size: int
@@ -116,7 +117,7 @@ class DocumentList:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentChunk:
     """
 
@@ -145,7 +146,7 @@ class DocumentChunk:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentChunksResponse:
     """
 
@@ -166,7 +167,7 @@ class DocumentChunksResponse:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentSearchResult:
     """
 
@@ -195,7 +196,7 @@ class DocumentSearchResult:
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentSearchResponse:
     """
 
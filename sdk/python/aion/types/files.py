@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
@@ -126,6 +127,11 @@ class UserFile:
         """Create UserFile from API response data."""
         ...
 
+    @classmethod
+    def from_details(cls, details: UserFileDetails) -> UserFile:
+        """Create a UserFile summary from a UserFileDetails instance."""
+        ...
+
 
 @dataclass(frozen=True)
 class UserFileDetails:
@@ -250,7 +256,7 @@ class FileList:
             total_count: Total number of files matching query
             has_more: Whether more files exist beyond current page
     """
-    files: list[UserFile]
+    files: Sequence[UserFile]
     total_count: int
     has_more: bool
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -205,7 +206,7 @@ class LinkList:
             total_count: Total number of links matching query
             has_more: Whether more links exist beyond current page
     """
-    links: list[LinkItem]
+    links: Sequence[LinkItem]
     total_count: int
     has_more: bool
 